@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
+import re
 import sys
-from pathlib import Path
+
+from _lint_common import is_domain_path, read_text, walk
 
 # Architectural Linter
 # Enforces Constitution §6.8 (Locality) and §5.3 (Boundaries)
@@ -10,10 +12,45 @@ RED = "\033[0;31m"
 GREEN = "\033[0;32m"
 NC = "\033[0m"
 
+SOURCE_SUFFIXES = (".hs", ".elm")
+
+# One precompiled alternation per language: a single C-side sweep over the
+# file replaces per-line substring tests in the interpreter. Group names
+# map to the violated rule via the dicts below.
+HS_FORBIDDEN = re.compile(
+    r"^[ \t]*import[ \t]+"
+    r"(?:(?P<eff>Effect)|(?P<app>App)|(?P<wf>Workflow)"
+    r"|(?P<http>Network\.HTTP)|(?P<db>Database)|(?P<sio>System\.IO))[^\n]*",
+    re.MULTILINE,
+)
+
+HS_RULES = {
+    "eff": "Domain MUST NOT import Effect (Inversion of Control)",
+    "app": "Domain MUST NOT import App (Circular Dependency)",
+    "wf": "Domain MUST NOT import Workflow (Layering)",
+    "http": "Domain MUST be pure (No HTTP)",
+    "db": "Domain MUST be pure (No DB)",
+    "sio": "Domain MUST be pure (No System.IO)",
+}
+
+ELM_FORBIDDEN = re.compile(
+    r"^[ \t]*import[ \t]+"
+    r"(?:(?P<http>Http)|(?P<json>Json\.Decode)|(?P<eff>Effect)|(?P<pages>Pages))"
+    r"[^\n]*",
+    re.MULTILINE,
+)
+
+ELM_RULES = {
+    "http": "Domain MUST be pure (No Http)",
+    "json": "Domain MUST be pure (No Decoders - use Api/)",
+    "eff": "Domain MUST NOT import Effect",
+    "pages": "Domain MUST NOT import Pages",
+}
+
 VIOLATIONS = []
 
 
-def report_violation(file_path: Path, illegal_import: str, rule: str) -> None:
+def report_violation(file_path: str, illegal_import: str, rule: str) -> None:
     VIOLATIONS.append(
         f"{RED}❌ [Arch Violation] {file_path}{NC}\n"
         f"   Imported: {illegal_import}\n"
@@ -21,78 +58,36 @@ def report_violation(file_path: Path, illegal_import: str, rule: str) -> None:
     )
 
 
-def check_haskell_file(file_path: Path) -> None:
-    content = file_path.read_text()
-
+def check_haskell_file(file_path: str, content: str) -> None:
     # 1. Domain Isolation Rule
     # Domain modules MUST NOT import Effect, App, or specific external IO libs
-    if "src/Domain" in str(file_path):
-        lines = content.split("\n")
-        for line in lines:
-            line = line.strip()
-            if not line.startswith("import"):
-                continue
-
-            # Forbidden internal layers
-            if "import Effect" in line:
-                report_violation(
-                    file_path,
-                    line,
-                    "Domain MUST NOT import Effect (Inversion of Control)",
-                )
-            if "import App" in line:
-                report_violation(
-                    file_path, line, "Domain MUST NOT import App (Circular Dependency)"
-                )
-            if "import Workflow" in line:
-                report_violation(
-                    file_path, line, "Domain MUST NOT import Workflow (Layering)"
-                )
-
-            # Forbidden IO libraries in Domain (Partial list of dangerous ones)
-            if "import Network.HTTP" in line:
-                report_violation(file_path, line, "Domain MUST be pure (No HTTP)")
-            if "import Database" in line:
-                report_violation(file_path, line, "Domain MUST be pure (No DB)")
-            if "import System.IO" in line:
-                report_violation(file_path, line, "Domain MUST be pure (No System.IO)")
-
-
-def check_elm_file(file_path: Path) -> None:
-    content = file_path.read_text()
+    # (callers only hand us files under src/Domain)
+    for m in HS_FORBIDDEN.finditer(content):
+        assert m.lastgroup is not None
+        report_violation(file_path, m.group(0).strip(), HS_RULES[m.lastgroup])
 
+
+def check_elm_file(file_path: str, content: str) -> None:
     # 1. Domain Isolation Rule
-    if "src/Domain" in str(file_path):
-        lines = content.split("\n")
-        for line in lines:
-            line = line.strip()
-            if not line.startswith("import"):
-                continue
-
-            if "import Http" in line:
-                report_violation(file_path, line, "Domain MUST be pure (No Http)")
-            if "import Json.Decode" in line:
-                report_violation(
-                    file_path, line, "Domain MUST be pure (No Decoders - use Api/)"
-                )
-            if "import Effect" in line:
-                report_violation(file_path, line, "Domain MUST NOT import Effect")
-            if "import Pages" in line:
-                report_violation(file_path, line, "Domain MUST NOT import Pages")
+    # (callers only hand us files under src/Domain)
+    for m in ELM_FORBIDDEN.finditer(content):
+        assert m.lastgroup is not None
+        report_violation(file_path, m.group(0).strip(), ELM_RULES[m.lastgroup])
 
 
 def check_architecture() -> None:
     print("🏰 Scanning Architectural Boundaries...")
 
-    # Walk through src/ looking for .hs and .elm files
-    root = Path(".")
-
-    for path in root.rglob("*"):
-        if path.is_file():
-            if path.suffix == ".hs":
-                check_haskell_file(path)
-            elif path.suffix == ".elm":
-                check_elm_file(path)
+    # Walk through the repo looking for .hs and .elm files; only files
+    # under src/Domain are subject to the rules, so nothing else is read.
+    for entry in walk(".", SOURCE_SUFFIXES):
+        if not is_domain_path(entry.path):
+            continue
+        content = read_text(entry.path)
+        if entry.name.endswith(".hs"):
+            check_haskell_file(entry.path, content)
+        else:
+            check_elm_file(entry.path, content)
 
     if VIOLATIONS:
         print(f"\n{len(VIOLATIONS)} Architectural Violations Found:\n")
@@ -2,7 +2,7 @@
 
 import re
 import sys
-from dataclasses import dataclass
+from bisect import bisect_right
 from pathlib import Path
 
 # Colors
@@ -12,61 +12,84 @@ YELLOW = "\033[1;33m"
 BLUE = "\033[0;34m"
 NC = "\033[0m"  # No Color
 
-VERSION_RE = re.compile(
-    r"^##\s+\[(?P<ver>\d+\.\d+\.\d+)\](?:\s*-\s*(?P<date>\d{4}-\d{2}-\d{2}))?\s*$"
+# The patterns run in MULTILINE mode over the whole buffer, so no list of
+# per-line strings is ever built; whitespace classes are [ \t] rather than
+# \s to keep each match confined to its own line.
+# One pattern for both section headers; dispatch on which named group
+# matched instead of trying two regexes per line.
+SECTION_RE = re.compile(
+    r"^##[ \t]+\[(?:(?P<unrel>Unreleased)|(?P<ver>\d+\.\d+\.\d+))\]"
+    r"(?:[ \t]*-[ \t]*(?P<date>\d{4}-\d{2}-\d{2}))?[ \t]*$",
+    re.IGNORECASE | re.MULTILINE,
 )
-UNRELEASED_RE = re.compile(r"^##\s+\[Unreleased\]\s*$", re.IGNORECASE)
-CATEGORY_RE = re.compile(
-    r"^###\s+(Added|Changed|Fixed|Removed|Security)\s*$", re.IGNORECASE
+# One pattern for everything the body checks care about: a known category
+# header, any other '### ' header, or a bullet item.
+BODY_RE = re.compile(
+    r"^###[ \t]+(?P<cat>Added|Changed|Fixed|Removed|Security)[ \t]*$"
+    r"|^(?P<hdr>[ \t]*###[ \t])"
+    r"|^(?P<bullet>[ \t]*[-*][ \t]+\S)",
+    re.IGNORECASE | re.MULTILINE,
 )
-BULLET_RE = re.compile(r"^\s*[-*]\s+\S+")
-
-
-@dataclass(frozen=True)
-class Section:
-    kind: str  # "unreleased" or "version"
-    version: str | None
-    date: str | None
-    start_line: int
-    lines: list[str]
-
-
-def parse_sections(lines: list[str]) -> list[Section]:
-    sections: list[Section] = []
-    current: Section | None = None
-
-    def flush() -> None:
-        nonlocal current
-        if current is not None:
-            sections.append(current)
-            current = None
-
-    for idx, raw in enumerate(lines, start=1):
-        line = raw.rstrip("\n")
-
-        if UNRELEASED_RE.match(line):
-            flush()
-            current = Section(
-                kind="unreleased", version=None, date=None, start_line=idx, lines=[]
-            )
-            continue
-
-        m = VERSION_RE.match(line)
-        if m:
-            flush()
-            current = Section(
-                kind="version",
-                version=m.group("ver"),
-                date=m.group("date"),
-                start_line=idx,
-                lines=[],
+NEWLINE_RE = re.compile(r"\n")
+
+
+class Sections:
+    """Parsed changelog sections in struct-of-arrays form.
+
+    Parallel lists keep the per-section fields dense instead of
+    scattering one small object per section across the heap; the
+    validation passes below index by position.
+    """
+
+    def __init__(self) -> None:
+        self.kinds: list[str] = []  # "unreleased" or "version"
+        self.versions: list[str | None] = []
+        self.dates: list[str | None] = []
+        self.start_lines: list[int] = []
+        # (start, end) character offsets of each body into the buffer —
+        # no per-line strings are materialized
+        self.body_spans: list[tuple[int, int]] = []
+
+    def __len__(self) -> int:
+        return len(self.kinds)
+
+    def append(
+        self,
+        kind: str,
+        version: str | None,
+        date: str | None,
+        start_line: int,
+        body_span: tuple[int, int],
+    ) -> None:
+        self.kinds.append(kind)
+        self.versions.append(version)
+        self.dates.append(date)
+        self.start_lines.append(start_line)
+        self.body_spans.append(body_span)
+
+
+def parse_sections(content: str) -> Sections:
+    # Offsets where each line starts; bisect maps a match offset to its
+    # 1-based line number without splitting the buffer into lines.
+    line_starts = [0]
+    for nl in NEWLINE_RE.finditer(content):
+        line_starts.append(nl.end())
+
+    sections = Sections()
+    headers = list(SECTION_RE.finditer(content))
+    end_of_file = len(content)
+
+    for j, m in enumerate(headers):
+        line_no = bisect_right(line_starts, m.start())
+        body_start = line_starts[line_no] if line_no < len(line_starts) else end_of_file
+        body_end = headers[j + 1].start() if j + 1 < len(headers) else end_of_file
+        if m["unrel"]:
+            sections.append("unreleased", None, None, line_no, (body_start, body_end))
+        else:
+            sections.append(
+                "version", m["ver"], m["date"], line_no, (body_start, body_end)
             )
-            continue
 
-        if current is not None:
-            current.lines.append(line)
-
-    flush()
     return sections
 
 
@@ -100,42 +123,44 @@ def main(argv: list[str]) -> int:
         return fail(f"changelog not found: {path}")
 
     content = path.read_text(encoding="utf-8")
-    lines = content.splitlines(True)
 
-    # Basic header sanity
-    if not any(line.strip().startswith("#") for line in lines[:20]):
+    # Basic header sanity on a cheap 2 KiB prefix
+    head = content[:2048]
+    # lstrip, not strip: only the leading side matters for a prefix test
+    if not any(line.lstrip().startswith("#") for line in head.splitlines()[:20]):
         return fail(
             "changelog parece não ter cabeçalho "
             "(nenhum '# ...' nas primeiras 20 linhas)"
         )
 
-    sections = parse_sections(lines)
+    # One multiline regex sweep over the buffer; no per-line string list.
+    sections = parse_sections(content)
 
-    if require_unreleased and not any(s.kind == "unreleased" for s in sections):
+    if require_unreleased and "unreleased" not in sections.kinds:
         return fail(
             "faltando seção '## [Unreleased]' (exigida por --require-unreleased)"
         )
 
-    # Collect version sections
-    versions = [s for s in sections if s.kind == "version"]
-    if not versions:
+    # Collect version sections (by index into the parallel arrays)
+    version_idx = [i for i in range(len(sections)) if sections.kinds[i] == "version"]
+    if not version_idx:
         return fail("nenhuma seção de versão encontrada (esperado: '## [x.y.z]')")
 
     # No duplicates
     seen: set[str] = set()
-    for s in versions:
-        assert s.version is not None
-        if s.version in seen:
+    for i in version_idx:
+        ver = sections.versions[i]
+        assert ver is not None
+        if ver in seen:
             return fail(
-                f"versão duplicada no changelog: [{s.version}] (linha {s.start_line})"
+                f"versão duplicada no changelog: [{ver}] "
+                f"(linha {sections.start_lines[i]})"
             )
-        seen.add(s.version)
+        seen.add(ver)
 
     # Descending order (top to bottom) check
-    sorted_desc = sorted(
-        (s.version for s in versions if s.version), key=semver_key, reverse=True
-    )
-    in_file = [s.version for s in versions if s.version]
+    in_file = [v for i in version_idx if (v := sections.versions[i])]
+    sorted_desc = sorted(in_file, key=semver_key, reverse=True)
     if in_file != sorted_desc:
         return fail(
             "seções de versão não estão em ordem decrescente. "
@@ -144,45 +169,49 @@ def main(argv: list[str]) -> int:
 
     # Require dates (optional)
     if require_dates:
-        missing = [s for s in versions if s.date is None]
-        if missing:
-            ex = missing[0]
-            return fail(
-                f"data ausente em [{ex.version}] (linha {ex.start_line}). "
-                f"Use: '## [{ex.version}] - YYYY-MM-DD'"
-            )
+        for i in version_idx:
+            if sections.dates[i] is None:
+                ver = sections.versions[i]
+                return fail(
+                    f"data ausente em [{ver}] (linha {sections.start_lines[i]}). "
+                    f"Use: '## [{ver}] - YYYY-MM-DD'"
+                )
 
     # Content sanity: each version must have at least one bullet item somewhere
-    for s in versions:
-        body = s.lines
-        has_bullet = any(BULLET_RE.match(line) for line in body)
+    for i in version_idx:
+        start, end = sections.body_spans[i]
+
+        # One BODY_RE pass over the body span feeds both checks: "has any
+        # bullet" and the soft rule "if categories exist, at least one
+        # bullet sits under a category".
+        has_bullet = False
+        has_category = False
+        under_category = False
+        bullet_under_category = False
+        for m in BODY_RE.finditer(content, start, end):
+            kind = m.lastgroup
+            if kind == "cat":
+                has_category = True
+                under_category = True
+            elif kind == "hdr":
+                under_category = False
+            else:  # bullet
+                has_bullet = True
+                if under_category:
+                    bullet_under_category = True
+                    break
+
         if not has_bullet:
             return fail(
-                f"seção [{s.version}] (linha {s.start_line}) "
+                f"seção [{sections.versions[i]}] (linha {sections.start_lines[i]}) "
                 "não contém nenhum item em lista (- ...)."
             )
 
-        # If categories exist, ensure bullets appear under some category,
-        # not only “floating” text
-        # (Soft rule: if there are categories, require at least one bullet
-        # after a category header)
-        categories = [i for i, line in enumerate(body) if CATEGORY_RE.match(line)]
-        if categories:
-            ok = False
-            for ci in categories:
-                for line in body[ci + 1 :]:
-                    if line.strip().startswith("### "):
-                        break
-                    if BULLET_RE.match(line):
-                        ok = True
-                        break
-                if ok:
-                    break
-            if not ok:
-                return fail(
-                    f"seção [{s.version}] tem categorias mas "
-                    f"nenhum bullet sob elas (linha {s.start_line})."
-                )
+        if has_category and not bullet_under_category:
+            return fail(
+                f"seção [{sections.versions[i]}] tem categorias mas "
+                f"nenhum bullet sob elas (linha {sections.start_lines[i]})."
+            )
 
     print(f"{GREEN}✅ Changelog validation passed!{NC}")
     return 0
@@ -1,7 +1,8 @@
 #!/usr/bin/env python3
 import re
 import sys
-from pathlib import Path
+
+from _lint_common import iter_files
 
 # Complexity & Hygiene Linter
 # Enforces:
@@ -12,48 +13,62 @@ RED = "\033[0;31m"
 GREEN = "\033[0;32m"
 NC = "\033[0m"
 
+SOURCE_SUFFIXES = (".py", ".hs", ".elm")
+
 MAX_LOC = 500
+# No sane source line averages anywhere near this many bytes, so a file
+# bigger than MAX_LOC * MAX_BYTES_PER_LINE is flagged on size alone
+# (typically generated output) without an exact line count.
+MAX_BYTES_PER_LINE = 200
 # Matches TODO(user) or FIXME(#123)
 # Negative lookahead checks that it's NOT followed by (
 # We split the string to avoid self-flagging by this very script
-TODO_PATTERN = re.compile(r"\b(TO" + r"DO|FIX" + r"ME)\b(?!\()")
+# A bytes pattern, so files are scanned without decoding them
+TODO_PATTERN = re.compile(rb"\b(TO" + rb"DO|FIX" + rb"ME)\b(?!\()")
 
 VIOLATIONS = []
 
 
-def check_file(path: Path) -> None:
-    try:
-        lines = path.read_text(encoding="utf-8").splitlines()
-    except UnicodeDecodeError:
-        return  # Skip binary files
+def check_file(path: str, data: bytes, size: int) -> None:
+    # Both checks run on the raw bytes: no decode, no per-line list.
 
-    # 1. LOC Check
-    if len(lines) > MAX_LOC:
+    # 1. LOC Check — C-level newline count instead of splitlines()
+    if size > MAX_LOC * MAX_BYTES_PER_LINE:
         VIOLATIONS.append(
-            f"{RED}❌ [Too Large] {path}: {len(lines)} lines (Max: {MAX_LOC}){NC}\n"
+            f"{RED}❌ [Too Large] {path}: >{MAX_LOC} lines ({size} bytes){NC}\n"
             f"   → AI Context Risk: Split this file immediately."
         )
-
-    # 2. Strict TO-DO Check
-    for i, line in enumerate(lines, 1):
-        if TODO_PATTERN.search(line):
+    else:
+        n_lines = data.count(b"\n") + (1 if data and not data.endswith(b"\n") else 0)
+        if n_lines > MAX_LOC:
             VIOLATIONS.append(
-                f"{RED}❌ [Bare TO-DO] {path}:{i}{NC}\n"
-                f"   → Found '{line.strip()}'\n"
-                f"   → Rule: Must use TODO(user) or TODO(#issue)"
+                f"{RED}❌ [Too Large] {path}: {n_lines} lines (Max: {MAX_LOC}){NC}\n"
+                f"   → AI Context Risk: Split this file immediately."
             )
 
+    # 2. Strict TO-DO Check
+    for m in TODO_PATTERN.finditer(data):
+        # Violations are rare, so recovering the line number and text
+        # per match is cheaper than splitting every clean file
+        line_no = data.count(b"\n", 0, m.start()) + 1
+        line_start = data.rfind(b"\n", 0, m.start()) + 1
+        line_end = data.find(b"\n", m.end())
+        if line_end == -1:
+            line_end = len(data)
+        line = data[line_start:line_end].decode("utf-8", "ignore")
+        VIOLATIONS.append(
+            f"{RED}❌ [Bare TO-DO] {path}:{line_no}{NC}\n"
+            f"   → Found '{line.strip()}'\n"
+            f"   → Rule: Must use TODO(user) or TODO(#issue)"
+        )
+
 
 def check_hygiene() -> None:
     print("🔍 Scanning for Complexity and Hygiene...")
 
-    root = Path(".")
-    # Scan src/ and scripts/
-    targets = list(root.glob("src/**/*")) + list(root.glob("scripts/**/*"))
-
-    for path in targets:
-        if path.is_file() and path.suffix in [".py", ".hs", ".elm"]:
-            check_file(path)
+    # Scan src/ and scripts/ in one lazy pass
+    for path, data, size in iter_files(("src", "scripts"), SOURCE_SUFFIXES):
+        check_file(path, data, size)
 
     if VIOLATIONS:
         print(f"\n{len(VIOLATIONS)} Hygiene Violations Found:\n")
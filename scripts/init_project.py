@@ -1,4 +1,6 @@
 #!/usr/bin/env python3
+import errno
+import os
 import shutil
 import sys
 from pathlib import Path
@@ -8,6 +10,18 @@ from pathlib import Path
 # Usage: ./scripts/init_project.py <new_backend_name> <new_frontend_name>
 
 
+def _move(src: Path, dst: Path) -> None:
+    # The common case is an in-repo rename on the same filesystem: a
+    # single atomic rename(2), no copy. Only fall back to shutil.move's
+    # copy-tree path when the target really is on another device.
+    try:
+        os.rename(src, dst)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.move(src, dst)
+
+
 def main() -> None:
     if len(sys.argv) < 3:
         print("Usage: init_project.py <backend_name> <frontend_name>", file=sys.stderr)
@@ -25,11 +39,11 @@ def main() -> None:
     src = root / "src"
     if (src / "backend").exists():
         print(f"Moving src/backend -> src/{backend_name}")
-        shutil.move(src / "backend", src / backend_name)
+        _move(src / "backend", src / backend_name)
 
     if (src / "frontend").exists():
         print(f"Moving src/frontend -> src/{frontend_name}")
-        shutil.move(src / "frontend", src / frontend_name)
+        _move(src / "frontend", src / frontend_name)
 
     # 2. Update Root Makefile (COMPONENTS list)
     # The Makefile logic `MODULES ?= $(patsubst src/%/,%,$(dir $(wildcard src/*/)))`
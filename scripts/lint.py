@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+import sys
+
+import check_architecture
+import check_complexity
+from _lint_common import is_domain_path, iter_files
+
+# Fused Linter
+# Runs the architecture and hygiene checks in a single tree walk, so a
+# pre-commit/CI pass reads each source file exactly once instead of
+# scanning the repo once per linter.
+
+RED = "\033[0;31m"
+GREEN = "\033[0;32m"
+NC = "\033[0m"
+
+SOURCE_SUFFIXES = (".py", ".hs", ".elm")
+
+
+def lint() -> None:
+    print("🔍 Running fused lint pass (architecture + hygiene)...")
+
+    for path, data, size in iter_files(("src", "scripts"), SOURCE_SUFFIXES):
+        check_complexity.check_file(path, data, size)
+        if is_domain_path(path):
+            # Only Domain files pay for the decode
+            text = data.decode("utf-8", "ignore")
+            if path.endswith(".hs"):
+                check_architecture.check_haskell_file(path, text)
+            elif path.endswith(".elm"):
+                check_architecture.check_elm_file(path, text)
+
+    violations = check_architecture.VIOLATIONS + check_complexity.VIOLATIONS
+    if violations:
+        print(f"\n{len(violations)} Violations Found:\n")
+        for v in violations:
+            print(v)
+        sys.exit(1)
+    else:
+        print(f"{GREEN}✅ All lint checks passed.{NC}")
+
+
+if __name__ == "__main__":
+    lint()
@@ -1,12 +1,72 @@
 #!/usr/bin/env python3
+import os
+import pickle
 import sys
 from pathlib import Path
-
-import yaml  # type: ignore
+from typing import Any
 
 # Config Reader
 # usage: ./read_config.py <key>
 # example: ./read_config.py author.name
+# Set NO_CONFIG_CACHE=1 to bypass the parse cache (e.g. in CI).
+
+# TOML is preferred: tomllib ships in the stdlib with a C parser, so the
+# common path never pays the PyYAML import cost. A YAML config is still
+# honored for scaffolds that haven't converted.
+CONFIG_CANDIDATES = (".project-config.toml", ".project-config.yaml")
+
+
+def _parse(config_path: Path) -> Any:
+    if config_path.suffix == ".toml":
+        import tomllib
+
+        with open(config_path, "rb") as f:
+            return tomllib.load(f)
+
+    # Lazy import: only the legacy YAML path pays for PyYAML
+    import yaml  # type: ignore
+
+    try:
+        # libyaml C backend: typically 5-10x faster than the pure-Python loader
+        from yaml import CSafeLoader as SafeLoader
+    except ImportError:
+        from yaml import SafeLoader
+
+    with open(config_path) as f:
+        return yaml.load(f, Loader=SafeLoader)
+
+
+def load_config(config_path: Path) -> Any:
+    """Parse the config, memoized across invocations in a pickle sidecar.
+
+    The cache is keyed by the source's (mtime_ns, size); unpickling a
+    small dict is far cheaper than re-parsing on every Makefile call.
+    """
+    stat = os.stat(config_path)
+    key = (stat.st_mtime_ns, stat.st_size)
+    cache_path = Path(f"{config_path}.cache")
+
+    use_cache = not os.environ.get("NO_CONFIG_CACHE")
+    if use_cache:
+        try:
+            cached_key, data = pickle.loads(cache_path.read_bytes())
+            if cached_key == key:
+                return data
+        except (OSError, pickle.PickleError, EOFError, ValueError):
+            pass  # missing/stale/corrupt cache: re-parse below
+
+    data = _parse(config_path)
+
+    if use_cache:
+        try:
+            tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as cf:
+                pickle.dump((key, data), cf)
+            os.replace(tmp_path, cache_path)  # atomic: old or new, never torn
+        except OSError:
+            pass  # the cache is best-effort only
+
+    return data
 
 
 def main() -> None:
@@ -15,17 +75,14 @@ def main() -> None:
         sys.exit(1)
 
     key_path = sys.argv[1].split(".")
-    config_path = Path(".project-config.yaml")
+    config_path = next((p for c in CONFIG_CANDIDATES if (p := Path(c)).exists()), None)
 
-    if not config_path.exists():
-        print(f"Error: {config_path} not found", file=sys.stderr)
+    if config_path is None:
+        print(f"Error: none of {', '.join(CONFIG_CANDIDATES)} found", file=sys.stderr)
         sys.exit(1)
 
     try:
-        with open(config_path) as f:
-            data = yaml.safe_load(f)
-
-        value = data
+        value = load_config(config_path)
         for key in key_path:
             if isinstance(value, dict) and key in value:
                 value = value[key]
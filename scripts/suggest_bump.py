@@ -2,6 +2,7 @@
 import re
 import subprocess
 import sys
+from collections.abc import Iterable, Iterator
 
 # SemVer Advisor
 # Analyzes git history since the last tag to suggest the next version bump.
@@ -16,7 +17,13 @@ YELLOW = "\033[1;33m"
 BLUE = "\033[0;34m"
 NC = "\033[0m"
 
-type BumpResult = tuple[str, str]
+# Conventional-commit patterns, compiled once at import: re's internal
+# cache is a bounded LRU, so per-commit re.search calls can re-compile.
+BREAKING_RE = re.compile(r"^[a-z]+(?:\([^)]*\))?!:")
+FEAT_RE = re.compile(r"^feat(?:\(|!?:)")
+
+type Commit = tuple[str, str]  # (subject, body)
+type BumpResult = tuple[str, str, int]  # (bump, reason, n_commits)
 type VersionTuple = tuple[int, int, int]
 
 
@@ -35,53 +42,75 @@ def get_latest_tag() -> str:
         return "v0.0.0"  # Fallback if no tags exist
 
 
-def get_commits_since(tag: str) -> list[str]:
+def _parse_record(record: bytes) -> Commit:
+    subject, _, body = record.decode("utf-8", "replace").partition("\x01")
+    return subject.strip(), body.strip()
+
+
+def get_commits_since(tag: str) -> Iterator[Commit]:
     # If tag is v0.0.0 and doesn't exist, log all commits
     rng = "HEAD" if tag == "v0.0.0" else f"{tag}..HEAD"
 
+    # NUL-delimit the records (and \x01-delimit subject from body):
+    # commit bodies contain newlines, so splitting on "\n" would produce
+    # bogus records. Stream git's stdout in chunks and yield commits as
+    # the records complete, instead of buffering the whole log in memory.
+    proc = subprocess.Popen(
+        ["git", "log", "--pretty=format:%s%x01%b%x00", rng],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+    )
+    assert proc.stdout is not None
+    buf = b""
     try:
-        logs = (
-            subprocess.check_output(
-                ["git", "log", "--pretty=%s|%b", rng], stderr=subprocess.DEVNULL
-            )
-            .decode()
-            .strip()
-            .split("\n")
-        )
-        return [line for line in logs if line]
-    except subprocess.CalledProcessError:
-        return []
-
-
-def analyze_bump(commits: list[str]) -> BumpResult:
-    if not commits:
-        return ("NONE", "No changes detected")
-
-    reason = "Default to PATCH for maintenance"
-
-    has_feat = False
+        while chunk := proc.stdout.read(65536):
+            buf += chunk
+            records = buf.split(b"\x00")
+            buf = records.pop()  # last piece may be incomplete
+            for record in records:
+                if record.strip():
+                    yield _parse_record(record)
+        if buf.strip():
+            yield _parse_record(buf)
+    finally:
+        proc.stdout.close()
+        proc.wait()  # a failed git (e.g. bad range) just yields nothing
+
+
+def _is_breaking(commit: Commit) -> bool:
+    subject, body = commit
+    return (
+        "BREAKING CHANGE" in subject
+        or "BREAKING CHANGE" in body
+        or BREAKING_RE.match(subject) is not None
+    )
+
+
+def analyze_bump(commits: Iterable[Commit]) -> BumpResult:
+    # Single pass over a (possibly lazy) commit stream: the first
+    # breaking commit decides MAJOR and further classification stops,
+    # else the first feat decides MINOR. (FEAT_RE rejects e.g.
+    # 'feature:'.) The stream is always drained so the commit count
+    # comes for free.
+    bump = "NONE"
+    reason = "No changes detected"
+    n_commits = 0
 
     for commit in commits:
-        subject, body = commit.split("|", 1) if "|" in commit else (commit, "")
-        full_text = f"{subject}\n{body}"
-
-        # 1. Check for BREAKING CHANGE
-        if (
-            "BREAKING CHANGE" in full_text
-            or re.search(r"^[a-z]+\(.*\)!:", subject)
-            or re.search(r"^[a-z]+!:", subject)
-        ):
-            return ("MAJOR", f"Breaking change detected: '{subject}'")
+        n_commits += 1
+        if bump == "MAJOR":
+            continue  # decided; keep draining only for the count
+        if _is_breaking(commit):
+            bump = "MAJOR"
+            reason = f"Breaking change detected: '{commit[0]}'"
+        elif bump == "NONE" and FEAT_RE.match(commit[0]):
+            bump = "MINOR"
+            reason = f"Feature detected: '{commit[0]}'"
 
-        # 2. Check for feat
-        if subject.startswith("feat"):
-            has_feat = True
-            reason = f"Feature detected: '{subject}'"
+    if n_commits and bump == "NONE":
+        bump, reason = "PATCH", "Only fixes/chores detected"
 
-    if has_feat:
-        return ("MINOR", reason)
-
-    return ("PATCH", "Only fixes/chores detected")
+    return (bump, reason, n_commits)
 
 
 def parse_version(tag: str) -> VersionTuple:
@@ -95,10 +124,8 @@ def main() -> None:
     tag = get_latest_tag()
     print(f"{BLUE}Current Version:{NC} {tag}")
 
-    commits = get_commits_since(tag)
-    print(f"{BLUE}Commits since tag:{NC} {len(commits)}")
-
-    bump_type, reason = analyze_bump(commits)
+    bump_type, reason, n_commits = analyze_bump(get_commits_since(tag))
+    print(f"{BLUE}Commits since tag:{NC} {n_commits}")
 
     if bump_type == "NONE":
         print(f"\n{YELLOW}No changes to release.{NC}")
@@ -113,9 +140,12 @@ def main() -> None:
     else:  # PATCH
         next_ver = f"v{major}.{minor}.{patch + 1}"
 
-    print(f"\n{GREEN}Suggested Bump:{NC} {bump_type}")
-    print(f"{GREEN}Next Version:{NC}  {next_ver}")
-    print(f"{YELLOW}Reason:{NC}        {reason}")
+    # One buffered write for the whole summary block
+    sys.stdout.write(
+        f"\n{GREEN}Suggested Bump:{NC} {bump_type}\n"
+        f"{GREEN}Next Version:{NC}  {next_ver}\n"
+        f"{YELLOW}Reason:{NC}        {reason}\n"
+    )
 
 
 if __name__ == "__main__":